@@ -4,28 +4,170 @@ This module provides a client for interacting with the ArgoCD API.
 It handles authentication, request formatting, and response parsing.
 """
 
-import os
-import logging
-from typing import Optional, Dict, Tuple, Any
-from urllib.parse import urljoin
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Optional, AsyncIterator, Callable, Dict, List, Tuple, Any
 import httpx
+from api.config import CONFIG
 
-# Constants
-# Default URL to use if no environment variable is set
-ARGOCD_API_URL_DEFAULT = "http://localhost:8080/api/v1"
+# ijson parses list responses incrementally; without it streamed requests
+# fall back to buffering the whole body
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-# Store default token from environment variable
-# Security note: API tokens are sensitive data and should never be logged or exposed
-DEFAULT_TOKEN = os.getenv("ARGOCD_TOKEN")
-DEFAULT_API_URL = os.getenv("ARGOCD_API_URL", ARGOCD_API_URL_DEFAULT)
+# orjson parses bytes directly and is several times faster than the stdlib
+# json module on large responses; fall back to stdlib json if unavailable
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    import json
+    from json import loads as _loads
 
-# SSL verification setting (set to False to disable SSL verification)
-# This is useful for development environments or when using self-signed certificates
-VERIFY_SSL = os.getenv("ARGOCD_VERIFY_SSL", "true").lower() != "false"
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
-# Log token presence but not the token itself
-if DEFAULT_TOKEN:
-    logging.info("Default token provided (masked for security)")
+# HTTP methods supported by make_api_request
+ALLOWED_METHODS = frozenset(("GET", "POST", "PUT", "PATCH", "DELETE"))
+
+# HTTP methods that send a JSON body
+BODY_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
+# Response codes treated as a successful request
+SUCCESS_CODES = frozenset((200, 201, 202, 204))
+
+# Error messages and templates, formatted only when the error occurs
+TOKEN_REQUIRED_ERROR = (
+    "Token is required. Please set the ARGOCD_TOKEN environment variable."
+)
+UNSUPPORTED_METHOD_ERROR = "Unsupported method: {}"
+TIMEOUT_ERROR = "Request timed out after {} seconds"
+
+# Connection pool limits shared by every pooled client
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# Use HTTP/2 when the h2 package is installed so concurrent tool calls share
+# one multiplexed connection. httpx negotiates it via ALPN and falls back to
+# HTTP/1.1 for servers that do not support it.
+HTTP2 = find_spec("h2") is not None
+
+# Pooled clients keyed by SSL verification setting. Reusing a client keeps
+# connections alive between tool calls instead of paying a new TCP/TLS
+# handshake for every request.
+_clients: Dict[bool, httpx.AsyncClient] = {}
+
+
+def _get_client(verify_ssl: bool) -> httpx.AsyncClient:
+    """
+    Get the pooled client for the given SSL verification setting
+
+    Clients are created lazily on first use and reused for all later requests.
+
+    Args:
+        verify_ssl: Whether the client should verify SSL certs
+
+    Returns:
+        A shared httpx.AsyncClient
+    """
+    client = _clients.get(verify_ssl)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            verify=verify_ssl, limits=POOL_LIMITS, http2=HTTP2
+        )
+        _clients[verify_ssl] = client
+    return client
+
+
+def dumps_json(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string with the client's JSON encoder
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Compact JSON string
+    """
+    encoded: bytes = _dumps(obj)
+    return encoded.decode()
+
+
+@lru_cache(maxsize=8)
+def _auth_headers(token: str) -> Dict[str, str]:
+    """
+    Build the request headers for a token
+
+    Cached so the header dict is built once per token rather than per request.
+    httpx copies headers internally, so sharing the dict is safe.
+
+    Args:
+        token: API token
+
+    Returns:
+        Headers with Authorization and Content-Type set
+    """
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+
+
+# Defaults are fixed for the server's lifetime, so the default headers and
+# base URL are built once at import instead of on every request
+DEFAULT_HEADERS = _auth_headers(CONFIG.token) if CONFIG.token else None
+DEFAULT_BASE_URL = CONFIG.api_url + "/"
+
+
+async def aclose() -> None:
+    """
+    Close all pooled clients
+
+    Should be called on server shutdown to release open connections.
+    """
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+def _prepare_request(
+    path: str,
+    token: Optional[str],
+    api_url: Optional[str],
+    params: Optional[Dict[str, Any]],
+    timeout: int,
+    verify_ssl: Optional[bool],
+) -> Optional[Tuple[str, httpx.AsyncClient, str, Dict[str, Any]]]:
+    """
+    Resolve the token, client, URL and request arguments shared by all requests
+
+    Args:
+        See make_api_request
+
+    Returns:
+        Tuple of (token, client, url, kwargs), or None if no token is available
+    """
+    token = token or CONFIG.token
+    if not token:
+        return None
+
+    headers = (
+        DEFAULT_HEADERS
+        if DEFAULT_HEADERS and token == CONFIG.token
+        else _auth_headers(token)
+    )
+
+    # Only pass query params when present so httpx can skip building empty
+    # QueryParams
+    kwargs: Dict[str, Any] = {"headers": headers, "timeout": timeout}
+    if params:
+        kwargs["params"] = params
+
+    # Use the provided verify_ssl value or fall back to the global setting
+    client = _get_client(CONFIG.verify_ssl if verify_ssl is None else verify_ssl)
+    url = (api_url + "/" if api_url else DEFAULT_BASE_URL) + path
+    return (token, client, url, kwargs)
 
 
 async def make_api_request(
@@ -33,8 +175,8 @@ async def make_api_request(
     method: str = "GET",
     token: Optional[str] = None,
     api_url: Optional[str] = None,
-    params: Dict[str, Any] = {},
-    data: Dict[str, Any] = {},
+    params: Optional[Dict[str, Any]] = None,
+    data: Optional[Dict[str, Any]] = None,
     timeout: int = 30,
     verify_ssl: Optional[bool] = None,
 ) -> Tuple[bool, Dict[str, Any]]:
@@ -44,8 +186,8 @@ async def make_api_request(
     Args:
         path: API path to request (without base URL)
         method: HTTP method (default: GET)
-        token: API token (defaults to DEFAULT_TOKEN)
-        api_url: ArgoCD API URL (defaults to DEFAULT_API_URL)
+        token: API token (defaults to the configured token)
+        api_url: ArgoCD API URL (defaults to the configured URL)
         params: Query parameters for the request (optional)
         data: JSON data for POST/PATCH requests (optional)
         timeout: Request timeout in seconds (default: 30)
@@ -54,79 +196,227 @@ async def make_api_request(
     Returns:
         Tuple of (success, data) where data is either the response JSON or an error dict
     """
-    if not token:
-        token = DEFAULT_TOKEN
+    if method not in ALLOWED_METHODS:
+        return (False, {"error": UNSUPPORTED_METHOD_ERROR.format(method)})
 
-    if not token:
-        return (
-            False,
-            {
-                "error": "Token is required. Please set the ARGOCD_TOKEN environment variable."
-            },
-        )
+    prepared = _prepare_request(path, token, api_url, params, timeout, verify_ssl)
+    if prepared is None:
+        return (False, {"error": TOKEN_REQUIRED_ERROR})
+    token, client, url, kwargs = prepared
 
-    if not api_url:
-        api_url = DEFAULT_API_URL
+    try:
+        if data and method in BODY_METHODS:
+            # Serialize ourselves; headers already carry the JSON content type
+            kwargs["content"] = _dumps(data)
+
+        response = await client.request(method, url, **kwargs)
+
+        # Handle different success response codes
+        if response.status_code in SUCCESS_CODES:
+            if response.status_code == 204:  # No content
+                return (True, {"status": "success"})
+            try:
+                return (True, _loads(response.content))
+            except ValueError:
+                return (True, {"status": "success", "raw_response": response.text})
+
+        return _error_response(response)
+    except Exception as e:
+        return _exception_response(e, timeout, token)
 
-    # Use the provided verify_ssl value or fall back to the global setting
-    ssl_verify = VERIFY_SSL if verify_ssl is None else verify_ssl
+
+async def stream_api_items(
+    path: str,
+    key: str = "items",
+    transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    token: Optional[str] = None,
+    api_url: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: int = 30,
+    verify_ssl: Optional[bool] = None,
+) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Make a streamed GET request and collect the items of a list response
+
+    The response body is parsed incrementally, so only one raw item is held
+    in memory at a time. Combined with a projection this keeps peak memory
+    proportional to the projected result instead of the full payload. Other
+    top-level fields of the response, such as list metadata, are returned
+    unchanged.
+
+    Successful responses that are not declared as JSON are handled like
+    make_api_request. A body declared as JSON that turns out to be malformed
+    can only be detected mid-stream, so it is reported as a request error
+    rather than returned as raw_response.
+
+    Args:
+        path: API path to request (without base URL)
+        key: Top-level key holding the list of items (default: items)
+        transform: Function applied to each item as it is parsed (optional)
+        token: API token (defaults to the configured token)
+        api_url: ArgoCD API URL (defaults to the configured URL)
+        params: Query parameters for the request (optional)
+        timeout: Request timeout in seconds (default: 30)
+        verify_ssl: Whether to verify SSL certs (default: global setting)
+
+    Returns:
+        Tuple of (success, data) where data is the response with projected
+        items or an error dict
+    """
+    prepared = _prepare_request(path, token, api_url, params, timeout, verify_ssl)
+    if prepared is None:
+        return (False, {"error": TOKEN_REQUIRED_ERROR})
+    token, client, url, kwargs = prepared
 
     try:
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-
-        async with httpx.AsyncClient(timeout=timeout, verify=ssl_verify) as client:
-            url = f"{api_url}/{path}"
-
-            if method == "GET":
-                response = await client.get(url, headers=headers, params=params)
-            elif method == "POST":
-                response = await client.post(
-                    url, headers=headers, params=params, json=data
-                )
-            elif method == "PUT":
-                response = await client.put(
-                    url, headers=headers, params=params, json=data
-                )
-            elif method == "PATCH":
-                response = await client.patch(
-                    url, headers=headers, params=params, json=data
+        async with client.stream("GET", url, **kwargs) as response:
+            if response.status_code not in SUCCESS_CODES:
+                await response.aread()
+                return _error_response(response)
+
+            result: Dict[str, Any] = {}
+            items: List[Dict[str, Any]] = []
+            content_type = response.headers.get("content-type", "")
+            if ijson is not None and "json" in content_type:
+                item_prefix = f"{key}.item"
+                events = aiter(
+                    ijson.parse_async(_ResponseReader(response), use_float=True)
                 )
-            elif method == "DELETE":
-                response = await client.delete(url, headers=headers, params=params)
+                async for prefix, event, value in events:
+                    if prefix == item_prefix:
+                        item = await _build_value(events, prefix, event, value)
+                        items.append(transform(item) if transform else item)
+                    elif prefix and prefix != key and "." not in prefix:
+                        # Other top-level fields, such as list metadata, are
+                        # small and kept whole
+                        result[prefix] = await _build_value(
+                            events, prefix, event, value
+                        )
             else:
-                return (False, {"error": f"Unsupported method: {method}"})
-
-            # Handle different success response codes
-            if response.status_code in [200, 201, 202, 204]:
+                # Without ijson, or for a body not declared as JSON, buffer and
+                # parse the whole body, handling it like make_api_request
+                await response.aread()
                 if response.status_code == 204:  # No content
                     return (True, {"status": "success"})
                 try:
-                    return (True, response.json())
+                    parsed = _loads(response.content)
                 except ValueError:
                     return (True, {"status": "success", "raw_response": response.text})
-            else:
-                error_message = f"API request failed: {response.status_code}"
-                try:
-                    error_data = response.json()
-                    # ArgoCD sometimes returns detailed error information
-                    if "error" in error_data:
-                        error_message = f"{error_message} - {error_data['error']}"
-                    return (False, {"error": error_message, "details": error_data})
-                except ValueError:
-                    # Try to get text response if JSON parsing fails
-                    error_text = response.text[:200] if response.text else ""
-                    return (False, {"error": f"{error_message} - {error_text}"})
-    except httpx.TimeoutException:
-        return (False, {"error": f"Request timed out after {timeout} seconds"})
-    except httpx.RequestError as e:
-        error_message = str(e)
-        return (False, {"error": f"Request error: {error_message}"})
+                for item in parsed.pop(key, None) or []:
+                    items.append(transform(item) if transform else item)
+                result.update(parsed)
+
+            result[key] = items
+            return (True, result)
     except Exception as e:
-        # Ensure no sensitive data is included in error messages
-        error_message = str(e)
-        if token and token in error_message:
-            error_message = error_message.replace(token, "[REDACTED]")
-        return (False, {"error": f"Request error: {error_message}"})
+        return _exception_response(e, timeout, token)
+
+
+async def _build_value(
+    events: AsyncIterator[Tuple[str, str, Any]], prefix: str, event: str, value: Any
+) -> Any:
+    """
+    Build the JSON value starting at the current ijson parse event
+
+    Args:
+        events: ijson parse event iterator, positioned just after the event
+        prefix: Prefix of the current event
+        event: Name of the current event
+        value: Value of the current event
+
+    Returns:
+        The complete value; containers are read up to their matching end event
+    """
+    if event not in ("start_map", "start_array"):
+        return value
+    builder = ijson.ObjectBuilder()
+    end_event = event.replace("start", "end")
+    current = prefix
+    while (current, event) != (prefix, end_event):
+        builder.event(event, value)
+        current, event, value = await anext(events)
+    return builder.value
+
+
+class _ResponseReader:
+    """
+    Async file-like adapter over a streamed response body, as read by ijson
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str; answer without
+        # consuming a chunk
+        if size == 0:
+            return b""
+        # Otherwise ijson only needs successive chunks, so the size is ignored
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+def _error_response(response: httpx.Response) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Build the error result for an unsuccessful response
+
+    Args:
+        response: Response with a non-success status code and a loaded body
+
+    Returns:
+        Tuple of (False, error dict)
+    """
+    error_message = f"API request failed: {response.status_code}"
+    try:
+        error_data = _loads(response.content)
+        # ArgoCD sometimes returns detailed error information
+        if "error" in error_data:
+            error_message = f"{error_message} - {error_data['error']}"
+        return (
+            False,
+            {
+                "error": error_message,
+                "details": error_data,
+                "status_code": response.status_code,
+            },
+        )
+    except ValueError:
+        # Try to get text response if JSON parsing fails. Slice the raw bytes
+        # before decoding so a large HTML error page is not decoded in full.
+        error_text = (
+            response.content[:200].decode("utf-8", errors="replace")
+            if response.content
+            else ""
+        )
+        return (
+            False,
+            {
+                "error": f"{error_message} - {error_text}",
+                "status_code": response.status_code,
+            },
+        )
+
+
+def _exception_response(
+    error: Exception, timeout: int, token: str
+) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Build the error result for an exception raised while making a request
+
+    Args:
+        error: The raised exception
+        timeout: Request timeout in seconds
+        token: API token used for the request, redacted from the message
+
+    Returns:
+        Tuple of (False, error dict)
+    """
+    if isinstance(error, httpx.TimeoutException):
+        return (False, {"error": TIMEOUT_ERROR.format(timeout)})
+    # Ensure no sensitive data is included in error messages
+    error_message = str(error)
+    if token and token in error_message:
+        error_message = error_message.replace(token, "[REDACTED]")
+    return (False, {"error": f"Request error: {error_message}"})
@@ -0,0 +1,52 @@
+"""ArgoCD MCP configuration
+
+Configuration is read from the environment once at import and stays fixed
+for the lifetime of the server.
+"""
+
+import os
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+logger = logging.getLogger("argocd_mcp")
+
+# Default URL to use if no environment variable is set
+ARGOCD_API_URL_DEFAULT = "http://localhost:8080/api/v1"
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Server configuration
+
+    Security note: API tokens are sensitive data and should never be logged
+    or exposed, so the token is left out of the repr.
+    """
+
+    token: Optional[str] = field(repr=False)
+    api_url: str
+    # SSL verification can be disabled for development environments or when
+    # using self-signed certificates
+    verify_ssl: bool
+
+
+def load_config() -> Config:
+    """
+    Load the configuration from environment variables
+
+    Returns:
+        Config built from ARGOCD_TOKEN, ARGOCD_API_URL and ARGOCD_VERIFY_SSL
+    """
+    return Config(
+        token=os.getenv("ARGOCD_TOKEN"),
+        api_url=os.getenv("ARGOCD_API_URL", ARGOCD_API_URL_DEFAULT),
+        verify_ssl=os.getenv("ARGOCD_VERIFY_SSL", "true").lower() != "false",
+    )
+
+
+CONFIG = load_config()
+
+# Log token presence but not the token itself
+if CONFIG.token:
+    logger.info("Default token provided (masked for security)")
@@ -4,7 +4,7 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationSource:
     """
     A source for an application - typically a Git repository
@@ -18,7 +18,7 @@ class ApplicationSource:
     directory: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationDestination:
     """
     The destination where an application will be deployed
@@ -29,7 +29,7 @@ class ApplicationDestination:
     name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationSyncPolicy:
     """
     Sync policy for an application
@@ -43,7 +43,7 @@ class ApplicationSyncPolicy:
     retry: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationStatus:
     """
     Status of an ArgoCD application
@@ -56,7 +56,7 @@ class ApplicationStatus:
     operation_state: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Application:
     """
     ArgoCD application model
@@ -81,7 +81,7 @@ def application_to_api_format(app: Application) -> Dict[str, Any]:
     Returns:
         Dictionary in ArgoCD API format
     """
-    source = {
+    source: Dict[str, Any] = {
         "repoURL": app.source.repo_url,
         "path": app.source.path,
         "targetRevision": app.source.target_revision,
@@ -89,13 +89,13 @@ def application_to_api_format(app: Application) -> Dict[str, Any]:
 
     # Add optional source fields if they exist
     if app.source.helm is not None:
-        source["helm"] = app.source.helm  # type: ignore
+        source["helm"] = app.source.helm
     if app.source.kustomize is not None:
-        source["kustomize"] = app.source.kustomize  # type: ignore
+        source["kustomize"] = app.source.kustomize
     if app.source.directory is not None:
-        source["directory"] = app.source.directory  # type: ignore
+        source["directory"] = app.source.directory
 
-    destination = {
+    destination: Dict[str, Any] = {
         "server": app.destination.server,
         "namespace": app.destination.namespace,
     }
@@ -103,14 +103,14 @@ def application_to_api_format(app: Application) -> Dict[str, Any]:
     if app.destination.name:
         destination["name"] = app.destination.name
 
-    result = {
+    result: Dict[str, Any] = {
         "metadata": {"name": app.name, "namespace": app.namespace},
         "spec": {"project": app.project, "source": source, "destination": destination},
     }
 
     # Add sync policy if provided
     if app.sync_policy:
-        sync_policy = {}
+        sync_policy: Dict[str, Any] = {}
 
         if app.sync_policy.automated:
             sync_policy["automated"] = {
@@ -121,7 +121,7 @@ def application_to_api_format(app: Application) -> Dict[str, Any]:
 
         if app.sync_policy.sync_options:
             # Convert to list for compatibility with API
-            sync_policy["syncOptions"] = list(app.sync_policy.sync_options)  # type: ignore
+            sync_policy["syncOptions"] = list(app.sync_policy.sync_options)
 
         if app.sync_policy.retry:
             sync_policy["retry"] = app.sync_policy.retry
@@ -144,62 +144,83 @@ def api_format_to_application(data: Dict[str, Any]) -> Application:
     Returns:
         Application object
     """
-    metadata = data.get("metadata", {})
-    spec = data.get("spec", {})
-    status_data = data.get("status", {})
+    # Fields are coerced to their declared types since the API may return
+    # null for any of them
+    metadata: Dict[str, Any] = data.get("metadata") or {}
+    spec: Dict[str, Any] = data.get("spec") or {}
+    status_data: Dict[str, Any] = data.get("status") or {}
 
     # Extract source information
-    source_data = spec.get("source", {})
+    source_data: Dict[str, Any] = spec.get("source") or {}
     source = ApplicationSource(
-        repo_url=source_data.get("repoURL", ""),
-        path=source_data.get("path", ""),
-        target_revision=source_data.get("targetRevision", "HEAD"),
+        repo_url=source_data.get("repoURL") or "",
+        path=source_data.get("path") or "",
+        target_revision=source_data.get("targetRevision") or "HEAD",
         helm=source_data.get("helm"),
         kustomize=source_data.get("kustomize"),
         directory=source_data.get("directory"),
     )
 
     # Extract destination information
-    dest_data = spec.get("destination", {})
+    dest_data: Dict[str, Any] = spec.get("destination") or {}
     destination = ApplicationDestination(
-        server=dest_data.get("server", ""),
-        namespace=dest_data.get("namespace", ""),
+        server=dest_data.get("server") or "",
+        namespace=dest_data.get("namespace") or "",
         name=dest_data.get("name"),
     )
 
     # Extract sync policy if available
-    sync_policy = None
-    if "syncPolicy" in spec:
-        sync_policy_data = spec["syncPolicy"]
-        automated = sync_policy_data.get("automated", {})
+    sync_policy: Optional[ApplicationSyncPolicy] = None
+    sync_policy_data: Optional[Dict[str, Any]] = spec.get("syncPolicy")
+    if sync_policy_data is not None:
+        automated: Dict[str, Any] = sync_policy_data.get("automated") or {}
 
         sync_policy = ApplicationSyncPolicy(
             automated=bool(automated),
-            prune=automated.get("prune", False),
-            self_heal=automated.get("selfHeal", False),
-            allow_empty=automated.get("allowEmpty", False),
-            sync_options=sync_policy_data.get("syncOptions"),
+            prune=bool(automated.get("prune")),
+            self_heal=bool(automated.get("selfHeal")),
+            allow_empty=bool(automated.get("allowEmpty")),
+            sync_options=sync_policy_data.get("syncOptions") or [],
             retry=sync_policy_data.get("retry"),
         )
 
     # Extract status if available
-    status = None
+    status: Optional[ApplicationStatus] = None
     if status_data:
+        sync_data: Dict[str, Any] = status_data.get("sync") or {}
+        health_data: Dict[str, Any] = status_data.get("health") or {}
         status = ApplicationStatus(
-            sync_status=status_data.get("sync", {}).get("status", "Unknown"),
-            health_status=status_data.get("health", {}).get("status", "Unknown"),
-            resources=status_data.get("resources", []),
-            conditions=status_data.get("conditions", []),
+            sync_status=sync_data.get("status") or "Unknown",
+            health_status=health_data.get("status") or "Unknown",
+            resources=status_data.get("resources") or [],
+            conditions=status_data.get("conditions") or [],
             operation_state=status_data.get("operationState"),
         )
 
     # Create the application object
     return Application(
-        name=metadata.get("name", ""),
-        project=spec.get("project", "default"),
+        name=metadata.get("name") or "",
+        project=spec.get("project") or "default",
         source=source,
         destination=destination,
         sync_policy=sync_policy,
-        namespace=metadata.get("namespace", "argocd"),
+        namespace=metadata.get("namespace") or "argocd",
         status=status,
     )
+
+
+def api_format_to_applications(
+    items: Optional[List[Dict[str, Any]]],
+) -> List[Application]:
+    """
+    Convert a list of ArgoCD API applications to Application objects
+
+    Args:
+        items: List of application dictionaries, e.g. the "items" of a
+            list applications response (ArgoCD returns null for no items)
+
+    Returns:
+        List of Application objects
+    """
+    convert = api_format_to_application
+    return [convert(item) for item in items or ()]
@@ -8,24 +8,45 @@ allowing large language models and AI assistants to manage ArgoCD resources.
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+# Load environment variables from .env file before the configuration is read
+load_dotenv()
+
+# Configure logging before importing the API modules, which may log at import
+# time (INFO by default, override with ARGOCD_MCP_LOG_LEVEL)
+log_level = os.getenv("ARGOCD_MCP_LOG_LEVEL", "INFO").upper()
+valid_log_level = isinstance(logging.getLevelName(log_level), int)
+logging.basicConfig(level=log_level if valid_log_level else logging.INFO)
+if not valid_log_level:
+    logging.warning("Invalid ARGOCD_MCP_LOG_LEVEL '%s', using INFO", log_level)
+
+# httpx and httpcore log every request at INFO/DEBUG; keep them quiet by default
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpcore").setLevel(logging.WARNING)
+
 # Import tools and models
-from api.client import DEFAULT_API_URL
+import api.client as client
 import tools.session as session
 import tools.applications as applications
 import tools.settings as settings
 import tools.version as version
 
-# Load environment variables from .env file
-load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close pooled API connections when the server shuts down"""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
 
 # Create server instance
-mcp = FastMCP("ArgoCD MCP Server")
+mcp = FastMCP("ArgoCD MCP Server", lifespan=lifespan)
 
 # Register session service tool - only provides user info via userinfo endpoint
 mcp.tool()(session.get_user_info)
@@ -40,6 +61,7 @@ mcp.tool()(version.get_version)
 # Register application tools
 mcp.tool()(applications.list_applications)
 mcp.tool()(applications.get_application_details)
+mcp.tool()(applications.get_applications_details)
 mcp.tool()(applications.create_application)
 mcp.tool()(applications.update_application)
 mcp.tool()(applications.delete_application)
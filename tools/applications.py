@@ -1,19 +1,56 @@
 """Application management tools for ArgoCD MCP"""
 
-from typing import Dict, Any, List, Optional, Union, cast
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union, cast
+import asyncio
 import logging
-from api.client import make_api_request
-from models.applications import (
-    application_to_api_format,
-    api_format_to_application,
-    Application,
-    ApplicationSource,
-    ApplicationDestination,
-    ApplicationSyncPolicy,
-)
+from api.client import dumps_json, make_api_request, stream_api_items
 
 logger = logging.getLogger("argocd_mcp")
 
+# Accepted values for tool parameters
+_REFRESH_VALUES = frozenset(("hard", "normal"))
+_SYNC_STRATEGIES = frozenset(("apply", "hook"))
+_PROPAGATION_POLICIES = frozenset(("foreground", "background", "orphan"))
+
+# Upper bound on concurrent requests issued by get_applications_details
+_DETAILS_SEMAPHORE = asyncio.Semaphore(20)
+
+# Status codes returned when the server cannot apply a merge patch, in which
+# case update_application falls back to a full GET-then-PUT update
+_PATCH_UNSUPPORTED_CODES = frozenset((405, 415, 501))
+
+
+def _field_projector(
+    fields: List[str],
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a function that keeps only the given dotted field paths of an item
+
+    Args:
+        fields: Dotted field paths, e.g. "metadata.name" or "status.sync.status"
+
+    Returns:
+        Function projecting an item onto the requested fields
+    """
+    paths = [field.split(".") for field in fields if field]
+
+    def project(item: Dict[str, Any]) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        for keys in paths:
+            value: Any = item
+            for key in keys:
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                target = result
+                for key in keys[:-1]:
+                    target = target.setdefault(key, {})
+                target[keys[-1]] = value
+        return result
+
+    return project
+
 
 async def list_applications(
     project: str = "",
@@ -21,6 +58,7 @@ async def list_applications(
     repo: str = "",
     namespace: str = "",
     refresh: str = "",
+    fields: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     List applications in ArgoCD with filtering options
@@ -31,6 +69,9 @@ async def list_applications(
         repo: Filter applications by repository URL
         namespace: Filter applications by namespace
         refresh: Forces application reconciliation if set to 'hard' or 'normal'
+        fields: Only return these dotted field paths for each application,
+            e.g. ["metadata.name", "status.sync.status"]; the list metadata
+            is still returned in full (optional)
 
     Returns:
         List of applications with pagination information
@@ -49,10 +90,17 @@ async def list_applications(
     if namespace:
         params["appNamespace"] = namespace
 
-    if refresh in ["hard", "normal"]:
+    if refresh in _REFRESH_VALUES:
         params["refresh"] = refresh
 
-    success, data = await make_api_request("applications", params=params)
+    if fields:
+        # Stream the response and keep only the requested fields so large
+        # application lists are never held in memory in full
+        success, data = await stream_api_items(
+            "applications", transform=_field_projector(fields), params=params
+        )
+    else:
+        success, data = await make_api_request("applications", params=params)
 
     if not success:
         return {"error": data.get("error", "Failed to retrieve applications")}
@@ -80,7 +128,7 @@ async def get_application_details(
     if project:
         params["project"] = project
 
-    if refresh in ["hard", "normal"]:
+    if refresh in _REFRESH_VALUES:
         params["refresh"] = refresh
 
     if namespace:
@@ -98,6 +146,47 @@ async def get_application_details(
         }
 
 
+async def get_applications_details(
+    names: List[str], project: str = "", namespace: str = ""
+) -> Dict[str, Any]:
+    """
+    Get details for several applications at once
+
+    Requests are issued concurrently over the shared connection pool, so the
+    total time is close to that of the slowest single request.
+
+    Args:
+        names: The application names (required)
+        project: The project name (optional filter)
+        namespace: Filter by application namespace
+
+    Returns:
+        Mapping of application name to its details or an error
+    """
+
+    # Results are keyed by name, so fetch each name once, in first-seen order
+    unique_names = list(dict.fromkeys(names))
+
+    async def fetch(name: str) -> Dict[str, Any]:
+        async with _DETAILS_SEMAPHORE:
+            return await get_application_details(name, project, "", namespace)
+
+    results = await asyncio.gather(
+        *(fetch(name) for name in unique_names), return_exceptions=True
+    )
+
+    return {
+        "applications": {
+            name: (
+                {"error": f"Failed to get details for application '{name}': {result}"}
+                if isinstance(result, BaseException)
+                else result
+            )
+            for name, result in zip(unique_names, results)
+        }
+    }
+
+
 async def create_application(
     name: str,
     project: str,
@@ -134,29 +223,27 @@ async def create_application(
     Returns:
         The created application details
     """
-    # Create application structure
-    app = Application(
-        name=name,
-        project=project,
-        source=ApplicationSource(
-            repo_url=repo_url, path=path, target_revision=revision
-        ),
-        destination=ApplicationDestination(
-            server=dest_server, namespace=dest_namespace
-        ),
-    )
+    # Build the API payload directly. This is a write-only path, so going
+    # through the Application dataclasses and application_to_api_format
+    # would only allocate objects that are never read again.
+    data: Dict[str, Any] = {
+        "metadata": {"name": name, "namespace": namespace or "argocd"},
+        "spec": {
+            "project": project,
+            "source": {
+                "repoURL": repo_url,
+                "path": path,
+                "targetRevision": revision,
+            },
+            "destination": {"server": dest_server, "namespace": dest_namespace},
+        },
+    }
 
     # Add sync policy if automated sync is enabled
     if automated_sync:
-        app.sync_policy = ApplicationSyncPolicy(
-            automated=True, prune=prune, self_heal=self_heal
-        )
-
-    if namespace:
-        app.namespace = namespace
-
-    # Convert to API format
-    data = application_to_api_format(app)
+        data["spec"]["syncPolicy"] = {
+            "automated": {"prune": prune, "selfHeal": self_heal, "allowEmpty": False}
+        }
 
     # Add query parameters
     params = {}
@@ -170,53 +257,109 @@ async def create_application(
     )
 
     if success:
-        logger.info(f"Application '{name}' created successfully")
+        logger.info("Application '%s' created successfully", name)
         return response
     else:
-        logger.error(f"Failed to create application '{name}': {response.get('error')}")
+        logger.error(
+            "Failed to create application '%s': %s", name, response.get("error")
+        )
         return {"error": response.get("error", "Failed to create application")}
 
 
-async def update_application(
+def _update_patch(
+    project: Optional[str],
+    repo_url: Optional[str],
+    path: Optional[str],
+    dest_server: Optional[str],
+    dest_namespace: Optional[str],
+    revision: Optional[str],
+    automated_sync: Optional[bool],
+    prune: Optional[bool],
+    self_heal: Optional[bool],
+) -> Optional[Dict[str, Any]]:
+    """
+    Build a JSON merge patch for the fields changed by update_application
+
+    Args:
+        See update_application
+
+    Returns:
+        The merge patch, or None if the update cannot be expressed as one
+    """
+    # prune/self_heal only touch an existing automated section unless
+    # automated sync is being enabled; a merge patch would create it instead
+    if (prune is not None or self_heal is not None) and automated_sync is not True:
+        return None
+
+    spec: Dict[str, Any] = {}
+    if project:
+        spec["project"] = project
+
+    source: Dict[str, Any] = {}
+    if repo_url:
+        source["repoURL"] = repo_url
+    if path:
+        source["path"] = path
+    if revision:
+        source["targetRevision"] = revision
+    if source:
+        spec["source"] = source
+
+    destination: Dict[str, Any] = {}
+    if dest_server:
+        destination["server"] = dest_server
+    if dest_namespace:
+        destination["namespace"] = dest_namespace
+    if destination:
+        spec["destination"] = destination
+
+    if automated_sync is True:
+        automated: Dict[str, Any] = {}
+        if prune is not None:
+            automated["prune"] = prune
+        if self_heal is not None:
+            automated["selfHeal"] = self_heal
+        spec["syncPolicy"] = {"automated": automated}
+    elif automated_sync is False:
+        # A null value removes the automated section
+        spec["syncPolicy"] = {"automated": None}
+
+    return {"spec": spec}
+
+
+async def _replace_application(
     name: str,
-    project: Optional[str] = None,
-    repo_url: Optional[str] = None,
-    path: Optional[str] = None,
-    dest_server: Optional[str] = None,
-    dest_namespace: Optional[str] = None,
-    revision: Optional[str] = None,
-    automated_sync: Optional[bool] = None,
-    prune: Optional[bool] = None,
-    self_heal: Optional[bool] = None,
-    validate: bool = True,
-) -> Dict[str, Any]:
+    project: Optional[str],
+    repo_url: Optional[str],
+    path: Optional[str],
+    dest_server: Optional[str],
+    dest_namespace: Optional[str],
+    revision: Optional[str],
+    automated_sync: Optional[bool],
+    prune: Optional[bool],
+    self_heal: Optional[bool],
+    validate: bool,
+) -> Tuple[bool, Dict[str, Any]]:
     """
-    Update an existing application in ArgoCD
+    Update an application by fetching it and writing back the full spec
 
     Args:
-        name: The application name to update (required)
-        project: New project name (optional)
-        repo_url: New Git repository URL (optional)
-        path: New path within the repository (optional)
-        dest_server: New destination K8s API server URL (optional)
-        dest_namespace: New destination namespace (optional)
-        revision: New Git revision (optional)
-        automated_sync: Enable/disable automated sync (optional)
-        prune: Enable/disable auto-pruning resources (optional)
-        self_heal: Enable/disable self-healing (optional)
-        validate: Whether to validate the application
+        See update_application
 
     Returns:
-        The updated application details
+        Tuple of (success, data) from the API
     """
     # First get the current application details
     success, app_data = await make_api_request(f"applications/{name}")
     if not success:
-        return {
-            "error": app_data.get(
-                "error", f"Failed to get current application details for '{name}'"
-            )
-        }
+        return (
+            False,
+            {
+                "error": app_data.get(
+                    "error", f"Failed to get current application details for '{name}'"
+                )
+            },
+        )
 
     # Update fields only if provided
     if project:
@@ -273,15 +416,94 @@ async def update_application(
         params["validate"] = "true"
 
     # Update the application
-    success, response = await make_api_request(
+    return await make_api_request(
         f"applications/{name}", method="PUT", data=app_data, params=params
     )
 
+
+async def update_application(
+    name: str,
+    project: Optional[str] = None,
+    repo_url: Optional[str] = None,
+    path: Optional[str] = None,
+    dest_server: Optional[str] = None,
+    dest_namespace: Optional[str] = None,
+    revision: Optional[str] = None,
+    automated_sync: Optional[bool] = None,
+    prune: Optional[bool] = None,
+    self_heal: Optional[bool] = None,
+    validate: bool = True,
+) -> Dict[str, Any]:
+    """
+    Update an existing application in ArgoCD
+
+    Args:
+        name: The application name to update (required)
+        project: New project name (optional)
+        repo_url: New Git repository URL (optional)
+        path: New path within the repository (optional)
+        dest_server: New destination K8s API server URL (optional)
+        dest_namespace: New destination namespace (optional)
+        revision: New Git revision (optional)
+        automated_sync: Enable/disable automated sync (optional)
+        prune: Enable/disable auto-pruning resources (optional)
+        self_heal: Enable/disable self-healing (optional)
+        validate: Whether to validate the application
+
+    Returns:
+        The updated application details
+    """
+    # Send only the changed fields as a merge patch where possible. This is a
+    # single round-trip with a small payload instead of a GET and a full PUT.
+    # ArgoCD's Patch handler always validates the result, so skipping
+    # validation requires the full update.
+    patch = (
+        _update_patch(
+            project,
+            repo_url,
+            path,
+            dest_server,
+            dest_namespace,
+            revision,
+            automated_sync,
+            prune,
+            self_heal,
+        )
+        if validate
+        else None
+    )
+
+    if patch is not None:
+        success, response = await make_api_request(
+            f"applications/{name}",
+            method="PATCH",
+            data={"name": name, "patch": dumps_json(patch), "patchType": "merge"},
+        )
+
+    if patch is None or (
+        not success and response.get("status_code") in _PATCH_UNSUPPORTED_CODES
+    ):
+        success, response = await _replace_application(
+            name,
+            project,
+            repo_url,
+            path,
+            dest_server,
+            dest_namespace,
+            revision,
+            automated_sync,
+            prune,
+            self_heal,
+            validate,
+        )
+
     if success:
-        logger.info(f"Application '{name}' updated successfully")
+        logger.info("Application '%s' updated successfully", name)
         return response
     else:
-        logger.error(f"Failed to update application '{name}': {response.get('error')}")
+        logger.error(
+            "Failed to update application '%s': %s", name, response.get("error")
+        )
         return {
             "error": response.get("error", f"Failed to update application '{name}'")
         }
@@ -304,11 +526,7 @@ async def delete_application(
     """
     params = {"cascade": str(cascade).lower()}
 
-    if propagation_policy and propagation_policy in [
-        "foreground",
-        "background",
-        "orphan",
-    ]:
+    if propagation_policy in _PROPAGATION_POLICIES:
         params["propagationPolicy"] = propagation_policy
 
     if namespace:
@@ -319,14 +537,18 @@ async def delete_application(
     )
 
     if success:
-        logger.info(f"Application '{name}' deleted successfully (cascade: {cascade})")
+        logger.info(
+            "Application '%s' deleted successfully (cascade: %s)", name, cascade
+        )
         return {
             "status": "success",
             "message": f"Application '{name}' deleted successfully",
             "details": data,
         }
     else:
-        logger.error(f"Failed to delete application '{name}': {data.get('error')}")
+        logger.error(
+            "Failed to delete application '%s': %s", name, data.get("error")
+        )
         return {
             "error": data.get("error", f"Failed to delete application '{name}'"),
             "details": data,
@@ -362,7 +584,7 @@ async def sync_application(
     if revision:
         data["revision"] = revision
 
-    if strategy and strategy in ["apply", "hook"]:
+    if strategy in _SYNC_STRATEGIES:
         data["strategy"] = {"hook": {}} if strategy == "hook" else {"apply": {}}
 
     if resources:
@@ -377,8 +599,10 @@ async def sync_application(
     )
 
     if success:
-        logger.info(f"Application '{name}' sync initiated")
+        logger.info("Application '%s' sync initiated", name)
         return response
     else:
-        logger.error(f"Failed to sync application '{name}': {response.get('error')}")
+        logger.error(
+            "Failed to sync application '%s': %s", name, response.get("error")
+        )
         return {"error": response.get("error", f"Failed to sync application '{name}'")}
@@ -1,10 +1,12 @@
 """Session service tools for ArgoCD MCP"""
 
-import os
 from typing import Dict, Any
 from api.client import make_api_request
+from utils.cache import async_ttl_cache
 
 
+# Kept short so permission or group changes show up quickly
+@async_ttl_cache(10)
 async def get_user_info() -> Dict[str, Any]:
     """
     Get the current user's info via session/userinfo
@@ -2,8 +2,11 @@
 
 from typing import Dict, Any
 from api.client import make_api_request
+from utils.cache import async_ttl_cache
 
 
+# Settings change rarely, so repeated calls are served from a short cache
+@async_ttl_cache(60)
 async def get_settings() -> Dict[str, Any]:
     """
     Get returns Argo CD settings using api/v1/settings
@@ -24,6 +27,8 @@ async def get_settings() -> Dict[str, Any]:
         return {"error": data.get("error", "Failed to retrieve ArgoCD settings")}
 
 
+# Plugin configuration changes rarely
+@async_ttl_cache(60)
 async def get_plugins() -> Dict[str, Any]:
     """
     Get returns Argo CD plugins using api/v1/settings/plugins
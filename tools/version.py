@@ -2,8 +2,16 @@
 
 from typing import Dict, Any
 from api.client import make_api_request
+from api.config import CONFIG
+from utils.cache import async_ttl_cache
 
+# The version endpoint lives at '/api/version' rather than under '/api/v1', so
+# requests go to the parent of the configured API URL
+VERSION_API_URL = CONFIG.api_url.rstrip("/").rsplit("/", 1)[0]
 
+
+# The server version only changes on upgrade
+@async_ttl_cache(300)
 async def get_version() -> Dict[str, Any]:
     """
     Version returns version information of the API server using api/version
@@ -14,9 +22,7 @@ async def get_version() -> Dict[str, Any]:
     Returns:
         Version information of the ArgoCD API server
     """
-    # Note: This endpoint uses a different base path ('/api/version' instead of '/api/v1/...')
-    # We need to modify the path to point to just 'version' since the client adds '/api/v1/'
-    success, data = await make_api_request("../version")
+    success, data = await make_api_request("version", api_url=VERSION_API_URL)
 
     if success:
         # Return the full version response
@@ -0,0 +1,63 @@
+"""Caching utilities for ArgoCD MCP"""
+
+import asyncio
+import copy
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, ParamSpec, Tuple
+
+P = ParamSpec("P")
+
+
+def async_ttl_cache(
+    ttl_seconds: float,
+) -> Callable[
+    [Callable[P, Awaitable[Dict[str, Any]]]], Callable[P, Awaitable[Dict[str, Any]]]
+]:
+    """
+    Cache the results of an async tool for a fixed time
+
+    Results are keyed by the call arguments. Concurrent calls that miss the
+    cache for the same key share a single request. Error results (dicts with
+    an "error" key) are never cached. Every caller receives its own copy of
+    a cached result, so mutating it does not affect later calls. The wrapped
+    function gains a cache_clear() method to drop all cached results.
+
+    Args:
+        ttl_seconds: How long a result stays cached, in seconds
+
+    Returns:
+        Decorator for async functions returning a dict
+    """
+
+    def decorator(
+        func: Callable[P, Awaitable[Dict[str, Any]]],
+    ) -> Callable[P, Awaitable[Dict[str, Any]]]:
+        entries: Dict[Hashable, Tuple[float, Dict[str, Any]]] = {}
+        locks: Dict[Hashable, asyncio.Lock] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Dict[str, Any]:
+            key = (args, tuple(sorted(kwargs.items())))
+
+            entry = entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return copy.deepcopy(entry[1])
+
+            lock = locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                # Another caller may have filled the cache while we waited
+                entry = entries.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return copy.deepcopy(entry[1])
+
+                result = await func(*args, **kwargs)
+                if "error" not in result:
+                    entries[key] = (time.monotonic() + ttl_seconds, result)
+                    return copy.deepcopy(result)
+                return result
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator